@@ -8,24 +8,29 @@
 import asyncio
 import hashlib
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 import platform
-import re
+import queue
 import signal
+import stat
+import threading
 import time
 import collections
+import functools
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 import orjson
-from config import load_config, save_config # 설정 모듈 가져오기
+from config import CONFIG_FILE_PATH, get_config_stamp, load_config, save_config # 설정 모듈 가져오기
 
 if platform.system() != "Windows":
     import uvloop
-    uvloop.install()
+else:
+    uvloop = None
 
 # Rich 라이브러리 구성 요소 가져오기
 from rich.console import Console, Group
@@ -38,59 +43,176 @@ from rich.text import Text
 # Rich를 위한 전역 콘솔 인스턴스
 console = Console()
 
-# 채널 진행 상황을 위한 공유 데이터 구조
-channel_progress: Dict[str, Dict[str, Any]] = {}
-channel_progress_lock = asyncio.Lock()
+@dataclass(slots=True)
+class ChannelProgress:
+    """녹화 중인 채널 하나의 진행 상황입니다. 녹화 시작 시 한 번 생성되고 이후 필드만 갱신됩니다."""
+    channel_name: str
+    recording_start_time: str
+    bitrate: str = "N/A"
+    download_speed: str = "N/A"
+    total_size: str = "N/A"
+    out_time: str = "N/A"
+    speed_ewma: Optional[float] = None  # ffmpeg speed 값의 지수 가중 이동 평균
+    version: int = 0  # 필드가 갱신될 때마다 증가 (대시보드가 변경된 채널만 다시 그리도록)
+
+    def update_speed(self, speed: float) -> None:
+        """새 speed 샘플을 이동 평균에 반영하고 표시 문자열을 갱신합니다."""
+        if self.speed_ewma is None:
+            self.speed_ewma = speed
+        else:
+            self.speed_ewma += SPEED_EWMA_ALPHA * (speed - self.speed_ewma)
+        self.download_speed = f"{self.speed_ewma:.2f}x"
+
+# 채널 진행 상황을 위한 공유 데이터 구조 (단일 이벤트 루프에서만 접근하므로 잠금이 필요 없음)
+channel_progress: Dict[str, ChannelProgress] = {}
+
+# 대시보드에 표시할 로그 메시지 큐 (리스너 스레드가 포맷팅된 문자열을 넣음)
+log_queue: queue.Queue = queue.Queue(maxsize=512)
 
-# 로그 메시지를 위한 큐 생성
-log_queue: asyncio.Queue = asyncio.Queue()
+# 새 로그나 진행 상황 변경이 있을 때 설정되어 대시보드를 깨우는 이벤트와, 다른 스레드에서 이를 설정할 때 쓰는 루프
+ui_dirty = asyncio.Event()
+ui_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 로거가 레코드를 넣는 큐와, 포맷팅 및 파일/대시보드 출력을 백그라운드 스레드에서 처리하는 리스너
+listener_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener: Optional[QueueListener] = None
 
 # --- 로깅 설정 ---
 
-class QueueHandler(logging.Handler):
-    """로그 레코드를 asyncio 큐에 넣는 로깅 핸들러입니다."""
-    def __init__(self, queue: asyncio.Queue):
+class UILogBridgeHandler(logging.Handler):
+    """리스너 스레드에서 로그를 포맷팅하여 대시보드 큐로 넘기는 로깅 핸들러입니다. 큐가 가득 차면 버립니다."""
+    def __init__(self, message_queue: queue.Queue):
         super().__init__()
-        self.queue = queue
+        self.message_queue = message_queue
 
     def emit(self, record):
-        msg = self.format(record)
         try:
-            self.queue.put_nowait(msg)
-        except asyncio.QueueFull:
-            pass
+            self.message_queue.put_nowait(self.format(record))
+        except queue.Full:
+            return
+        # 대시보드가 이미 깨어날 예정이 아니면 이벤트 루프 스레드에서 ui_dirty를 설정
+        loop = ui_loop
+        if loop is not None and not ui_dirty.is_set():
+            try:
+                loop.call_soon_threadsafe(ui_dirty.set)
+            except RuntimeError:  # 루프가 이미 닫힌 경우
+                pass
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """64KB 버퍼로 파일을 열고, 레코드마다가 아니라 최대 1초에 한 번만 flush하는 회전 파일 핸들러입니다.
+
+    바로 flush하지 못한 레코드는 타이머가 FLUSH_INTERVAL 안에 기록하고, WARNING 이상은 즉시 기록합니다.
+    기본 회전 판단은 레코드마다 seek/tell로 버퍼를 비우므로, 대신 직접 센 파일 크기로 회전 여부를 판단합니다.
+    """
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, *args, **kwargs):
+        # delay=False이면 기본 클래스 생성자가 _open()을 호출하므로 크기 상태를 먼저 초기화
+        self._file_size = 0  # 현재 파일 크기 (열 때 한 번 확인하고 이후에는 쓴 길이만큼 더함)
+        self._regular_file = True  # 일반 파일이 아니면 회전하지 않음 (bpo-45401)
+        self._pending_size = 0  # shouldRollover에서 계산한, 이번 레코드가 쓸 길이
+        super().__init__(*args, **kwargs)
+        self._last_flush = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        st = os.fstat(stream.fileno())
+        self._file_size = st.st_size
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:  # delay=True로 아직 열지 않은 경우
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            self._pending_size = 0
+            return False
+        # 기본 구현과 같이 문자 수로 어림하되, 버퍼를 비우는 seek/tell과 레코드마다의 stat 없이 판단
+        self._pending_size = len(self.format(record)) + 1
+        return self._regular_file and self._file_size + self._pending_size >= self.maxBytes
 
-class FfmpegStderrFilter(logging.Filter):
-    """특정 ffmpeg stderr 메시지를 제외하기 위한 로깅 필터입니다."""
-    def filter(self, record):
-        msg = record.getMessage()
-        return not ("ffmpeg stderr" in msg and "Invalid DTS" in msg)
+    def emit(self, record):
+        super().emit(record)
+        self._file_size += self._pending_size
+        # 오류 직전의 기록이 버퍼에 남아 사라지지 않도록 경고 이상은 바로 디스크에 씀
+        if record.levelno >= logging.WARNING:
+            self._flush_now()
+
+    def flush(self):
+        now = time.monotonic()
+        if now - self._last_flush >= self.FLUSH_INTERVAL:
+            self._flush_now()
+        elif self._flush_timer is None:
+            # 로그가 뜸해져도 버퍼에 남은 줄이 늦어도 FLUSH_INTERVAL 뒤에는 기록되도록 예약
+            self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_now(self):
+        self._last_flush = time.monotonic()
+        super().flush()
+
+    def _timed_flush(self):
+        with self.lock:
+            self._flush_timer = None
+            self._flush_now()
+
+    def close(self):
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._last_flush = 0.0
+        super().close()
 
 def setup_logger(config: Dict[str, Any]) -> logging.Logger:
     """애플리케이션의 메인 로거를 구성하고 반환합니다."""
     logger = logging.getLogger("Recorder")
-    logger.setLevel(logging.DEBUG)
+    # 모든 핸들러가 INFO 이상만 처리하므로 DEBUG 레코드는 로거 단계에서 걸러냄
+    logger.setLevel(logging.INFO)
 
-    # 이전 핸들러 제거
+    # 이전 핸들러 및 로그 리스너 제거
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    stop_logging()
+
+    ui_handler = UILogBridgeHandler(log_queue)
+    ui_handler.setLevel(logging.INFO)
+    ui_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    target_handlers: List[logging.Handler] = [ui_handler]
 
     if config.get("recorder_settings", {}).get("logging_enabled", True):
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        file_handler = RotatingFileHandler("log.log", maxBytes=10*1024*1024, backupCount=5, encoding="utf-8")
+        file_handler = BufferedRotatingFileHandler("log.log", maxBytes=10*1024*1024, backupCount=5, encoding="utf-8", delay=True)
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(FfmpegStderrFilter())
-        logger.addHandler(file_handler)
+        target_handlers.append(file_handler)
 
-    queue_handler = QueueHandler(log_queue)
+    # 이벤트 루프에서는 큐에 넣기만 하고, 포맷팅과 파일 쓰기는 리스너 스레드가 담당
+    queue_handler = QueueHandler(listener_queue)
     queue_handler.setLevel(logging.INFO)
-    queue_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
     logger.addHandler(queue_handler)
 
+    global log_listener
+    log_listener = QueueListener(listener_queue, *target_handlers, respect_handler_level=True)
+    log_listener.start()
+
     logger.propagate = False
     return logger
 
+def stop_logging():
+    """로그 리스너를 중지하고 남은 레코드를 모두 처리한 뒤 대상 핸들러를 닫습니다."""
+    global log_listener
+    if log_listener is None:
+        return
+    log_listener.stop()
+    for handler in log_listener.handlers:
+        handler.close()
+    log_listener = None
+
 # 초기 설정 로드 및 로거 설정
 config = load_config()
 logger = setup_logger(config)
@@ -104,15 +226,58 @@ print(
 # --- 상수 및 전역 변수 ---
 LIVE_DETAIL_API = "https://api.chzzk.naver.com/service/v3/channels/{channel_id}/live-detail"
 PLUGIN_DIR_PATH = Path("plugin")
-SPECIAL_CHARS_REMOVER = re.compile('[\\/:*?"<>|\U0001F300-\U0001F5FF\U0001F600-\U0001F64F\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\u2600-\u26FF\u2700-\u27BF\uFE0F]')
+# 파일 이름에 쓸 수 없는 문자와 이모지 범위를 삭제하는 str.translate 테이블
+SPECIAL_CHARS_TABLE = dict.fromkeys(
+    [ord(c) for c in '\\/:*?"<>|\uFE0F']
+    + [cp for start, end in (
+        (0x1F300, 0x1F5FF), (0x1F600, 0x1F64F), (0x1F680, 0x1F6FF),
+        (0x1F1E0, 0x1F1FF), (0x2600, 0x26FF), (0x2700, 0x27BF),
+    ) for cp in range(start, end + 1)]
+)
+LIVE_POLL_CONCURRENCY = 16
+API_TIMEOUT = aiohttp.ClientTimeout(total=30)
 MAX_FILENAME_BYTES = 255
 MAX_HASH_LENGTH = 8
+SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(SIZE_NAMES)))
 shutdown_event = asyncio.Event()
-time_pattern = re.compile(r"(\d+):(\d+):(\d+)\.(\d+)")
-speed_samples = collections.deque(maxlen=5)
+shutdown_waiter: Optional[asyncio.Future] = None  # 모든 대기 지점이 공유하는 shutdown_event.wait() 작업
+STREAM_READ_SIZE = 4096
+STREAM_DRAIN_SIZE = 65536
+FFMPEG_STDERR_TAIL_LINES = 10
+# 대시보드에 필요한 ffmpeg -progress 키 (그 외의 키는 파싱하지 않음)
+FFMPEG_PROGRESS_KEYS = frozenset((b"bitrate", b"total_size", b"out_time", b"speed", b"progress"))
+SPEED_EWMA_ALPHA = 0.2
+# 녹화마다 달라지지 않는 명령줄 인자 (채널 URL, 스레드 수, 쿠키, 실행 파일 경로만 녹화 작업에서 덧붙임)
+STREAMLINK_STATIC_ARGS = (
+    "--hls-live-restart", "--plugin-dirs", str(PLUGIN_DIR_PATH),
+    "--http-header", "User-Agent=Mozilla/5.0 (X11; Unix x86_64)",
+    "--http-header", "Origin=https://chzzk.naver.com",
+    "--http-header", "DNT=1",
+    "--http-header", "Sec-GPC=1",
+    "--http-header", "Connection=keep-alive",
+    "--http-header", "Referer=https://chzzk.naver.com/",
+    "--ffmpeg-copyts", "--hls-segment-stream-data",
+)
+FFMPEG_COPY_ARGS = (
+    "-i", "pipe:0", "-c", "copy",
+    "-copy_unknown", "-map_metadata:s:a", "0:s:a",
+    "-map_metadata:s:v", "0:s:v",
+    "-bsf:v", "h264_mp4toannexb",
+    "-bsf:a", "aac_adtstoasc",
+    "-f", "mpegts", "-mpegts_flags", "resend_headers",
+    "-bsf", "setts=pts=PTS-STARTPTS",
+    "-fflags", "+genpts+discardcorrupt+nobuffer",
+    "-avioflags", "direct",
+)
 
 # --- 헬퍼 함수 ---
 
+async def load_config_async() -> Dict[str, Any]:
+    """config.json을 스레드 풀에서 한 번에 읽고 orjson으로 파싱합니다."""
+    data = await asyncio.to_thread(Path(CONFIG_FILE_PATH).read_bytes)
+    return orjson.loads(data)
+
 async def setup_paths() -> Optional[Path]:
     """ffmpeg 실행 파일의 경로를 결정합니다."""
     base_dir = Path(__file__).parent
@@ -152,22 +317,41 @@ async def setup_paths() -> Optional[Path]:
         logger.error(f"{os_name}에서 ffmpeg를 찾는 중 오류 발생: {e}")
         return None
 
+@functools.lru_cache(maxsize=8)
+def format_cookie_header(nid_aut: str, nid_ses: str) -> str:
+    """인증 쿠키 값으로 Cookie 헤더 문자열을 만듭니다. 쿠키가 바뀔 때만 새로 생성됩니다."""
+    return f"NID_AUT={nid_aut}; NID_SES={nid_ses}"
+
 def get_auth_headers(cookies: Dict[str, str]) -> Dict[str, str]:
     """쿠키 값으로 인증 헤더를 구성합니다."""
     return {
         "User-Agent": "Mozilla/5.0 (X11; Unix x86_64)",
-        "Cookie": f"NID_AUT={cookies.get('NID_AUT', '')}; NID_SES={cookies.get('NID_SES', '')}",
+        "Cookie": format_cookie_header(cookies.get("NID_AUT", ""), cookies.get("NID_SES", "")),
         "Origin": "https://chzzk.naver.com",
         "Referer": "https://chzzk.naver.com",
     }
 
-async def get_live_info(channel: Dict[str, Any], headers: Dict[str, str], session: aiohttp.ClientSession) -> Tuple[str, Dict[str, Any]]:
+async def sleep_or_shutdown(delay: float) -> bool:
+    """최대 delay초 동안 기다리며, 그 사이 종료 신호를 받으면 즉시 True를 반환합니다."""
+    global shutdown_waiter
+    if shutdown_waiter is None:
+        shutdown_waiter = asyncio.ensure_future(shutdown_event.wait())
+    done, _ = await asyncio.wait((shutdown_waiter,), timeout=delay)
+    return bool(done)
+
+def create_api_session(connector: aiohttp.TCPConnector, headers: Dict[str, str]) -> aiohttp.ClientSession:
+    """인증 헤더를 기본 헤더로 갖는 API 세션을 생성합니다. 커넥터는 세션 간에 공유됩니다."""
+    return aiohttp.ClientSession(
+        connector=connector, connector_owner=False, headers=headers, timeout=API_TIMEOUT,
+    )
+
+async def get_live_info(channel: Dict[str, Any], session: aiohttp.ClientSession) -> Tuple[str, Dict[str, Any]]:
     """주어진 채널의 라이브 스트림 정보를 가져옵니다."""
     url = LIVE_DETAIL_API.format(channel_id=channel["id"])
     try:
-        async with session.get(url, headers=headers) as response:
+        async with session.get(url) as response:
             response.raise_for_status()
-            data = await response.json()
+            data = orjson.loads(await response.read())
             content = data.get("content", {})
             status = content.get("status", "CLOSE")
 
@@ -181,11 +365,82 @@ async def get_live_info(channel: Dict[str, Any], headers: Dict[str, str], sessio
         logger.error(f"{channel.get('name', 'Unknown')}의 라이브 정보를 가져오는 데 실패했습니다: {e}")
     return "CLOSE", {}
 
+class LiveStatusPoller:
+    """대기 중인 모든 채널의 라이브 상태를 한 번에 조회하고, 라이브가 시작된 채널의 녹화 작업을 깨웁니다.
+
+    각 `record_stream` 작업이 개별적으로 폴링하는 대신 `wait_until_live`로 대기하며,
+    폴러는 재검색 간격마다 대기 중인 채널 전체를 동시성 제한 하에 `asyncio.gather`로 조회합니다.
+    새로 대기를 시작한 채널은 다음 주기를 기다리지 않고 즉시 조회됩니다.
+    """
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self._waiting: Dict[str, Tuple[Dict[str, Any], asyncio.Future]] = {}
+        self._fresh: set = set()
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(LIVE_POLL_CONCURRENCY)
+
+    async def wait_until_live(self, channel: Dict[str, Any]) -> Dict[str, Any]:
+        """채널이 라이브 상태가 될 때까지 기다린 뒤 라이브 정보를 반환합니다."""
+        channel_id = str(channel["id"])
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[channel_id] = (channel, future)
+        self._fresh.add(channel_id)
+        self._wakeup.set()
+        try:
+            return await future
+        finally:
+            self._waiting.pop(channel_id, None)
+            self._fresh.discard(channel_id)
+
+    async def _fetch(self, channel: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        async with self._semaphore:
+            return await get_live_info(channel, self.session)
+
+    async def _poll(self, channel_ids: List[str]):
+        """주어진 채널들의 라이브 상태를 한 번에 조회합니다."""
+        targets = [self._waiting[cid] for cid in channel_ids if cid in self._waiting]
+        if not targets:
+            return
+        results = await asyncio.gather(*(self._fetch(channel) for channel, _ in targets))
+        timeout = config["recorder_settings"]["rescan_interval"]
+        for (channel, future), (status, live_info) in zip(targets, results):
+            if future.done():
+                continue
+            if status == "OPEN":
+                future.set_result(live_info)
+            else:
+                logger.info(f"'{channel.get('name', 'Unknown')}' 채널이 라이브 상태가 아닙니다. {timeout}초 후 다시 확인합니다.")
+
+    async def run(self):
+        """재검색 간격마다 대기 중인 채널 전체를 조회합니다."""
+        loop = asyncio.get_running_loop()
+        next_full_poll = loop.time()
+        while not shutdown_event.is_set():
+            self._wakeup.clear()
+            if loop.time() >= next_full_poll:
+                targets = list(self._waiting)
+                next_full_poll = loop.time() + config["recorder_settings"]["rescan_interval"]
+            else:
+                targets = list(self._fresh)
+            self._fresh.clear()
+            await self._poll(targets)
+
+            # 다음 전체 조회 시각에 스스로 깨어나도록 타이머를 걸고, 새 대기 채널이 생기면 더 일찍 깨어남
+            timer = loop.call_later(max(0.0, next_full_poll - loop.time()), self._wakeup.set)
+            try:
+                await self._wakeup.wait()
+            finally:
+                timer.cancel()
+
 def shorten_filename(filename: str) -> str:
     """파일 이름이 너무 길 경우 줄입니다."""
-    if len(filename.encode('utf-8')) > MAX_FILENAME_BYTES:
+    # UTF-8은 문자당 최대 4바이트이므로, 이 길이 이하면 인코딩 없이 한도 안임이 보장됨
+    if len(filename) <= MAX_FILENAME_BYTES // 4:
+        return filename
+    filename_bytes = filename.encode('utf-8')
+    if len(filename_bytes) > MAX_FILENAME_BYTES:
         base, ext = os.path.splitext(filename)
-        hash_value = hashlib.sha256(filename.encode('utf-8')).hexdigest()[:MAX_HASH_LENGTH]
+        hash_value = hashlib.blake2b(filename_bytes, digest_size=MAX_HASH_LENGTH // 2).hexdigest()
         max_base_len = MAX_FILENAME_BYTES - len(ext.encode('utf-8')) - 1 - MAX_HASH_LENGTH
         shortened_base = base.encode('utf-8')[:max_base_len].decode('utf-8', 'ignore')
         short_filename = f"{shortened_base}_{hash_value}{ext}"
@@ -193,169 +448,217 @@ def shorten_filename(filename: str) -> str:
         return short_filename
     return filename
 
-def format_size(size_bytes: float) -> str:
+def finalize_recording(temp_path: Path, final_path: Path) -> Optional[str]:
+    """임시 녹화 파일을 최종 파일 이름으로 옮기고 그 경로를 반환합니다. 임시 파일이 없으면 None을 반환합니다."""
+    if not temp_path.exists():
+        return None
+    final_path_short = shorten_filename(str(final_path))
+    os.replace(temp_path, final_path_short)
+    return final_path_short
+
+def format_size(size_bytes: int) -> str:
     """바이트를 사람이 읽기 쉬운 형식으로 변환합니다."""
     if size_bytes <= 0: return "0 B"
-    size_names = ("B", "KB", "MB", "GB", "TB")
-    i = int(size_bytes.bit_length() / 10)
-    p = 1024 ** i
-    s = size_bytes / p
-    return f"{s:.2f} {size_names[i]}"
-
-def parse_time(time_str: str) -> float:
-    """ffmpeg 시간 문자열을 초로 변환합니다."""
-    match = time_pattern.match(time_str)
-    if not match: return 0.0
-    h, m, s, ms = map(int, match.groups())
-    return h * 3600 + m * 60 + s + ms / 100
-
-async def read_stream(stream: asyncio.StreamReader, channel_id: str, stream_name: str):
-    """Reads from a stream and logs the output, parsing ffmpeg progress if applicable."""
-    summary = {}
-    while not stream.at_eof():
-        line = await stream.readline()
-        if not line:
+    i = min((size_bytes.bit_length() - 1) // 10, len(SIZE_NAMES) - 1)
+    return f"{size_bytes / SIZE_DIVISORS[i]:.2f} {SIZE_NAMES[i]}"
+
+async def open_progress_pipe() -> Tuple[asyncio.ReadTransport, asyncio.StreamReader, int]:
+    """ffmpeg -progress 출력을 받을 전용 파이프를 엽니다.
+
+    읽기 끝은 이벤트 루프에 StreamReader로 연결하고, 자식 프로세스에 넘길 쓰기 fd를 함께 반환합니다.
+    """
+    read_fd, write_fd = os.pipe()
+    reader = asyncio.StreamReader()
+    try:
+        transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(read_fd, "rb", 0))
+    except BaseException:
+        os.close(write_fd)
+        raise
+    return transport, reader, write_fd
+
+async def drain_stream(stream: asyncio.StreamReader, tail: collections.deque):
+    """스트림을 큰 단위로 읽어 버리고, 오류 보고용으로 마지막 몇 줄만 `tail`에 보관합니다."""
+    while True:
+        chunk = await stream.read(STREAM_DRAIN_SIZE)
+        if not chunk:
+            break
+        tail.extend(chunk.splitlines()[-tail.maxlen:])
+
+async def read_stream(stream: asyncio.StreamReader, channel_id: str, stream_name: str, progress: Optional[ChannelProgress] = None):
+    """Reads from a stream and logs the output, parsing ffmpeg progress into `progress` if given."""
+    parse_progress = progress is not None
+    summary: Dict[bytes, bytes] = {}
+    last_total_size, last_total_size_str = b"", "N/A"
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(STREAM_READ_SIZE)
+        if not chunk:
             break
-        line_str = line.decode(errors="ignore").strip()
-        logger.debug(f"{stream_name} for {channel_id}: {line_str}")
+        buffer += chunk
+        end = buffer.rfind(b"\n")
+        if end == -1:
+            continue  # 아직 완성된 줄이 없음
+        # 완성된 줄만 잘라내고, 마지막 미완성 조각은 버퍼에 남김
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[:end + 1]
+
+        # Avoid building debug strings unless debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            for line in lines:
+                logger.debug("%s for %s: %s", stream_name, channel_id, line.decode(errors="ignore").strip())
 
         # Only parse progress for ffmpeg's stderr
-        if stream_name == "ffmpeg_stderr":
-            if "=" in line_str:
-                key, value = map(str.strip, line_str.split("=", 1))
-                summary[key] = value
-
-            # When a progress block is complete, update the shared dictionary
-            if summary.get("progress") in ["continue", "end"]:
-                async with channel_progress_lock:
-                    if channel_id in channel_progress:
-                        # Extract and format data from summary
-                        bitrate = summary.get("bitrate", "N/A").strip()[:-7] + " kbps"
-                        total_size_str = summary.get("total_size", "0").strip()
-                        total_size = format_size(int(total_size_str)) if total_size_str.isdigit() else "N/A"
-                        out_time = summary.get("out_time", "N/A").strip()[:-4]
-                        speed = summary.get("speed", "N/A").strip()
-
-                        channel_progress[channel_id].update({
-                            "bitrate": bitrate,
-                            "total_size": total_size,
-                            "out_time": out_time,
-                            "download_speed": speed
-                        })
-                
-                # If progress is finished, add a final status and clear summary
-                if summary.get("progress") == "end":
-                    async with channel_progress_lock:
-                        if channel_id in channel_progress:
-                            channel_progress[channel_id]["download_speed"] = "완료" # Completed
-                    summary.clear()
+        if not parse_progress:
+            continue
+
+        for line in lines:
+            key, sep, value = line.partition(b"=")
+            if not sep:
+                continue
+            key = key.strip()
+            if key not in FFMPEG_PROGRESS_KEYS:
+                continue
+            value = value.strip()
+            summary[key] = value
+            if key != b"progress":
+                continue
+
+            # When a progress block is complete, update this channel's slot.
+            # Each channel owns its slot and everything runs on one event loop, so no lock is needed.
+            progress.bitrate = summary.get(b"bitrate", b"N/A")[:-7].decode(errors="ignore") + " kbps"
+            total_size_bytes = summary.get(b"total_size", b"0")
+            if total_size_bytes != last_total_size:
+                last_total_size = total_size_bytes
+                last_total_size_str = format_size(int(total_size_bytes)) if total_size_bytes.isdigit() else "N/A"
+            progress.total_size = last_total_size_str
+            progress.out_time = summary.get(b"out_time", b"N/A")[:-4].decode(errors="ignore")
+            # If progress is finished, add a final status
+            if value == b"end":
+                progress.download_speed = "완료" # Completed
+            else:
+                try:
+                    progress.update_speed(float(summary.get(b"speed", b"").rstrip(b"x")))
+                except ValueError:
+                    pass  # ffmpeg가 아직 속도를 모르면 "N/A"를 출력
+            progress.version += 1
+            ui_dirty.set()
+            summary.clear()
 
 # --- 녹화 로직 ---
 
-async def record_stream(channel: Dict[str, Any], headers: Dict[str, str], session: aiohttp.ClientSession, ffmpeg_path: Path):
-    """단일 채널의 라이브 스트림을 녹화합니다."""
-    global config
+@dataclass(slots=True)
+class RecordingOptions:
+    """모든 녹화 작업이 공유하는 설정 값입니다. 설정이 다시 로드되면 관리자가 갱신하고, 각 작업은 재연결할 때마다 읽습니다."""
+    cookies: Dict[str, str]
+    threads: int
+
+async def record_stream(channel: Dict[str, Any], poller: LiveStatusPoller, ffmpeg_path: Path,
+                        options: RecordingOptions, delay: float):
+    """단일 채널의 라이브 스트림을 녹화합니다.
+
+    쿠키와 스레드 수는 재연결마다 `options`에서 읽으므로, 설정에서 갱신한 쿠키가 다음 방송부터 적용됩니다.
+    """
     channel_name = channel.get("name", "Unknown")
     channel_id = str(channel.get("id", "Unknown"))
-    delay = config.get("delays", {}).get(channel.get("identifier", ""), 0)
-    timeout = config["recorder_settings"]["rescan_interval"]
-    threads = config["recorder_settings"]["threads"]
+    channel_output_dir = Path(channel.get("output_dir", "./recordings")).expanduser()
+
+    if channel.get("active", "on") == "off":
+        logger.info(f"{channel_name} 채널이 비활성 상태입니다. 녹화를 건너뜁니다.")
+        return
+
+    # 재연결마다 달라지지 않는 명령줄은 한 번만 구성합니다. (출력 경로와 진행 파이프만 매번 추가)
+    stream_url = f"https://chzzk.naver.com/live/{channel_id}"
+    ffmpeg_base_cmd = (str(ffmpeg_path), *FFMPEG_COPY_ARGS)
+    streamlink_cmd: Tuple[str, ...] = ()
+    cmd_options: Optional[Tuple[Dict[str, str], int]] = None
 
     logger.info(f"채널 스트림 녹화 시도: {channel_name} (딜레이: {delay}초)")
-    await asyncio.sleep(delay)
+    if await sleep_or_shutdown(delay):
+        return
 
     while not shutdown_event.is_set():
-        if channel.get("active", "on") == "off":
-            logger.info(f"{channel_name} 채널이 비활성 상태입니다. 녹화를 건너뜁니다.")
-            return
-
-        status, live_info = await get_live_info(channel, headers, session)
-        if status != "OPEN":
-            logger.info(f"'{channel_name}' 채널이 라이브 상태가 아닙니다. {timeout}초 후 다시 확인합니다.")
-            try:
-                await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
-            except asyncio.TimeoutError:
-                continue
-            continue
+        live_info = await poller.wait_until_live(channel)
+
+        cookies, threads = options.cookies, options.threads
+        if cmd_options is None or cmd_options[0] is not cookies or cmd_options[1] != threads:
+            # 설정 리로드로 쿠키 객체나 스레드 수가 바뀐 경우에만 streamlink 명령줄을 재구성
+            cmd_options = (cookies, threads)
+            cookie = format_cookie_header(cookies.get("NID_AUT", ""), cookies.get("NID_SES", ""))
+            streamlink_cmd = (
+                "streamlink", "--stdout", stream_url, "best", *STREAMLINK_STATIC_ARGS,
+                "--stream-segment-threads", str(threads),
+                "--http-header", f"Cookie={cookie}",
+                "--ffmpeg-ffmpeg", str(ffmpeg_path),
+            )
 
-        cookies = config.get("cookies", {})
         current_time = time.strftime("%Y-%m-%d_%H-%M-%S")
-        live_title = SPECIAL_CHARS_REMOVER.sub("", live_info.get("liveTitle", "live"))
-        output_dir = Path(channel.get("output_dir", "./recordings")).expanduser()
-        output_dir.mkdir(parents=True, exist_ok=True)
+        live_title = live_info.get("liveTitle", "live").translate(SPECIAL_CHARS_TABLE)
+        await asyncio.to_thread(channel_output_dir.mkdir, parents=True, exist_ok=True)
 
         filename = f"[{channel_name}] - {live_title} [{current_time}].ts"
-        temp_path = output_dir / f"{filename}.part"
-        final_path = output_dir / filename
-
-        stream_url = f"https://chzzk.naver.com/live/{channel_id}"
-        read_pipe, write_pipe = os.pipe()
-        streamlink_cmd = [
-            "streamlink", "--stdout", stream_url, "best",
-            "--hls-live-restart", "--plugin-dirs", str(PLUGIN_DIR_PATH),
-            "--stream-segment-threads", str(threads),
-            "--http-header", f'Cookie=NID_AUT={cookies.get("NID_AUT", "")}; NID_SES={cookies.get("NID_SES", "")}',
-            "--http-header", "User-Agent=Mozilla/5.0 (X11; Unix x86_64)",
-            "--http-header", "Origin=https://chzzk.naver.com",
-            "--http-header", "DNT=1",
-            "--http-header", "Sec-GPC=1",
-            "--http-header", "Connection=keep-alive",
-            "--http-header", "Referer=https://chzzk.naver.com/",
-            "--ffmpeg-ffmpeg", str(ffmpeg_path),
-            "--ffmpeg-copyts", "--hls-segment-stream-data",
-        ]
-
-        ffmpeg_cmd = [
-            str(ffmpeg_path), "-i", "pipe:0", "-c", "copy", "-progress", "pipe:2",
-            "-copy_unknown", "-map_metadata:s:a", "0:s:a",
-            "-map_metadata:s:v", "0:s:v",
-            "-bsf:v", "h264_mp4toannexb",
-            "-bsf:a", "aac_adtstoasc",
-            "-f", "mpegts", "-mpegts_flags", "resend_headers",
-            "-bsf", "setts=pts=PTS-STARTPTS",
-            "-fflags", "+genpts+discardcorrupt+nobuffer",
-            "-avioflags", "direct",
-            "-y", str(temp_path)
-        ]
+        temp_path = channel_output_dir / f"{filename}.part"
+        final_path = channel_output_dir / filename
 
         stream_process, ffmpeg_process = None, None
-        streamlink_stderr_task, ffmpeg_stderr_task = None, None
+        streamlink_stderr_task, ffmpeg_stderr_task, ffmpeg_progress_task = None, None, None
+        progress_transport: Optional[asyncio.ReadTransport] = None
+        progress_reader: Optional[asyncio.StreamReader] = None
+        ffmpeg_stderr_tail: collections.deque = collections.deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+        ffmpeg_exit_code: Optional[int] = None
         try:
             logger.info(f"'{channel_name}' 녹화를 시작합니다: {filename}")
 
+            # streamlink의 stdout을 ffmpeg의 stdin에 커널 파이프로 직접 연결합니다.
+            # 부모 프로세스가 가진 파이프 끝은 자식에게 넘긴 직후 닫고, 생성 실패나 취소 시에는
+            # 아직 열려 있는 것만 finally에서 닫습니다.
             read_pipe, write_pipe = os.pipe()
-
-            stream_process = await asyncio.create_subprocess_exec(
-                *streamlink_cmd,
-                stdout=write_pipe,
-                stderr=asyncio.subprocess.PIPE
-            )
-            os.close(write_pipe)
-
-            ffmpeg_process = await asyncio.create_subprocess_exec(
-                *ffmpeg_cmd,
-                stdin=read_pipe,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            os.close(read_pipe)
-
-            async with channel_progress_lock:
-                channel_progress[channel_id] = {
-                    "channel_name": channel_name, 
-                    "bitrate": "N/A", 
-                    "download_speed": "N/A",
-                    "total_size": "N/A", 
-                    "out_time": "N/A",
-                    "recording_start_time": time.strftime("%Y-%m-%d %H:%M:%S")
-                }
+            progress_write: Optional[int] = None
+            try:
+                stream_process = await asyncio.create_subprocess_exec(
+                    *streamlink_cmd,
+                    stdout=write_pipe,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                os.close(write_pipe)
+                write_pipe = None
+
+                # -progress 출력은 stderr와 분리하여 받습니다.
+                # POSIX에서는 전용 파이프를, pass_fds가 없는 Windows에서는 stdout을 사용합니다.
+                pass_fds: Tuple[int, ...] = ()
+                progress_url = "pipe:1"
+                if os.name == "posix":
+                    progress_transport, progress_reader, progress_write = await open_progress_pipe()
+                    progress_url = f"pipe:{progress_write}"
+                    pass_fds = (progress_write,)
+                ffmpeg_cmd = (*ffmpeg_base_cmd, "-nostats", "-progress", progress_url, "-y", str(temp_path))
+
+                ffmpeg_process = await asyncio.create_subprocess_exec(
+                    *ffmpeg_cmd,
+                    stdin=read_pipe,
+                    stdout=asyncio.subprocess.DEVNULL if progress_reader is not None else asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    **({"pass_fds": pass_fds} if pass_fds else {})
+                )
+            finally:
+                for fd in (read_pipe, write_pipe, progress_write):
+                    if fd is not None:
+                        os.close(fd)
+            if progress_reader is None:
+                progress_reader = ffmpeg_process.stdout
+
+            progress = ChannelProgress(channel_name, time.strftime("%Y-%m-%d %H:%M:%S"))
+            channel_progress[channel_id] = progress
+            ui_dirty.set()
 
             streamlink_stderr_task = asyncio.create_task(
                 read_stream(stream_process.stderr, channel_id, "streamlink_stderr"))
             ffmpeg_stderr_task = asyncio.create_task(
-                read_stream(ffmpeg_process.stderr, channel_id, "ffmpeg_stderr"))
+                drain_stream(ffmpeg_process.stderr, ffmpeg_stderr_tail))
+            ffmpeg_progress_task = asyncio.create_task(
+                read_stream(progress_reader, channel_id, "ffmpeg_progress", progress))
 
-            await ffmpeg_process.wait()
+            ffmpeg_exit_code = await ffmpeg_process.wait()
         
         finally:
             logger.info(f"Cleaning up recording for '{channel_name}'...")
@@ -368,34 +671,51 @@ async def record_stream(channel: Dict[str, Any], headers: Dict[str, str], sessio
 
             # Wait for processes and tasks to finish
             tasks_to_wait = []
-            if streamlink_stderr_task:
-                streamlink_stderr_task.cancel()
-                tasks_to_wait.append(streamlink_stderr_task)
-            if ffmpeg_stderr_task:
-                ffmpeg_stderr_task.cancel()
-                tasks_to_wait.append(ffmpeg_stderr_task)
-            
+            for task in (streamlink_stderr_task, ffmpeg_stderr_task, ffmpeg_progress_task):
+                if task:
+                    task.cancel()
+                    tasks_to_wait.append(task)
+
             procs_to_wait = []
             if stream_process: procs_to_wait.append(stream_process.wait())
             if ffmpeg_process: procs_to_wait.append(ffmpeg_process.wait())
 
             if tasks_to_wait or procs_to_wait:
                 await asyncio.gather(*tasks_to_wait, *procs_to_wait, return_exceptions=True)
+            if progress_transport:
+                progress_transport.close()
+
+            # ffmpeg가 스스로 오류 종료한 경우에만 stderr 마지막 몇 줄을 기록
+            if ffmpeg_exit_code:
+                logger.warning(
+                    "'%s' ffmpeg가 코드 %s(으)로 종료되었습니다:\n%s", channel_name, ffmpeg_exit_code,
+                    "\n".join(line.decode(errors="ignore") for line in ffmpeg_stderr_tail))
 
             # Post-recording file operations
-            if temp_path.exists():
-                final_path_short = shorten_filename(str(final_path))
-                temp_path.rename(final_path_short)
+            final_path_short = await asyncio.to_thread(finalize_recording, temp_path, final_path)
+            if final_path_short:
                 logger.info(f"녹화가 저장되었습니다: {final_path_short}")
             elif ffmpeg_process and ffmpeg_process.returncode == 0:
                 logger.warning(f"'{channel_name}' 녹화 파일이 생성되지 않았습니다.")
 
-            async with channel_progress_lock:
-                channel_progress.pop(channel_id, None)
+            channel_progress.pop(channel_id, None)
+            ui_dirty.set()
+
+class ShutdownRequested(Exception):
+    """녹화 작업 그룹 전체를 한 번에 취소하기 위해 TaskGroup 안에서 발생시키는 예외입니다."""
+
+async def supervise_recording(channel: Dict[str, Any], poller: LiveStatusPoller, ffmpeg_path: Path,
+                              options: RecordingOptions, delay: float):
+    """record_stream의 예외를 기록하여, 한 채널의 오류가 작업 그룹 전체를 취소하지 않도록 합니다."""
+    try:
+        await record_stream(channel, poller, ffmpeg_path, options, delay)
+    except Exception:
+        logger.exception(f"'{channel.get('name', 'Unknown')}' 채널 녹화 작업 중 오류가 발생했습니다.")
 
 async def manage_recording_tasks():
     """현재 설정에 따라 모든 활성 녹화 작업을 관리합니다."""
     global config
+    # 채널 ID로 작업을 찾기 위한 색인 (작업의 소유와 취소는 TaskGroup이 담당)
     active_tasks: Dict[str, asyncio.Task] = {}
     ffmpeg_path = await setup_paths()
 
@@ -403,15 +723,51 @@ async def manage_recording_tasks():
         logger.error("ffmpeg 실행 파일을 찾을 수 없습니다. 종료합니다.")
         return
 
+    config_stamp: Optional[Tuple[int, int]] = None
+    headers = get_auth_headers(config.get("cookies", {}))
+
+    # 모든 폴링이 같은 API 호스트로 가므로 DNS 결과와 keep-alive 연결을 재사용 (세션을 교체해도 커넥터는 유지)
+    connector = aiohttp.TCPConnector(
+        limit=0, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75,
+    )
+    poller = LiveStatusPoller(create_api_session(connector, headers))
+    options = RecordingOptions(config.get("cookies", {}), config["recorder_settings"]["threads"])
+
+    def forget_task(channel_id: str, task: asyncio.Task):
+        # 끝난 작업은 색인에서 제거하여 다음 주기에 다시 시작될 수 있도록 함
+        if active_tasks.get(channel_id) is task:
+            del active_tasks[channel_id]
+
     try:
-        async with aiohttp.ClientSession() as session:
-            while not shutdown_event.is_set():
-                config = load_config()  # 설정 동적 리로드
-                setup_logger(config) # 로거 재설정
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(poller.run())
 
-                headers = get_auth_headers(config.get("cookies", {}))
-                active_channels = [ch for ch in config.get("channels", []) if ch.get("active", "on") == "on"]
-                current_ids = {str(ch["id"]) for ch in active_channels}
+            while not shutdown_event.is_set():
+                # 파일이 변경된 경우에만 설정을 다시 읽고 로거와 헤더를 재구성
+                stamp = get_config_stamp()
+                if stamp is not None and stamp != config_stamp:
+                    config = await load_config_async()  # 설정 동적 리로드
+                    setup_logger(config) # 로거 재설정
+                    new_headers = get_auth_headers(config.get("cookies", {}))
+                    if new_headers != headers:
+                        # 쿠키가 바뀐 경우에만 새 기본 헤더를 가진 세션으로 교체
+                        headers = new_headers
+                        old_session, poller.session = poller.session, create_api_session(connector, headers)
+                        await old_session.close()
+                    # 실행 중인 녹화 작업은 다음 재연결 때 새 쿠키와 스레드 수를 사용
+                    # (쿠키 값이 같으면 객체를 교체하지 않아 명령줄을 다시 만들지 않음)
+                    new_cookies = config.get("cookies", {})
+                    if new_cookies != options.cookies:
+                        options.cookies = new_cookies
+                    options.threads = config["recorder_settings"]["threads"]
+                    config_stamp = stamp
+
+                # 시작 딜레이는 채널 목록에서의 위치로 정하여, 채널을 추가/삭제해도 두 채널이 같은 딜레이를 갖지 않도록 함
+                active_channels = [
+                    (position, ch) for position, ch in enumerate(config.get("channels", []))
+                    if ch.get("active", "on") == "on"
+                ]
+                current_ids = {str(ch["id"]) for _, ch in active_channels}
 
                 # 종료된 작업 정리
                 for channel_id in list(active_tasks.keys()):
@@ -419,31 +775,32 @@ async def manage_recording_tasks():
                         task = active_tasks.pop(channel_id)
                         task.cancel()
                         logger.info(f"채널 {channel_id}의 녹화 작업이 비활성화되어 취소되었습니다.")
-                        async with channel_progress_lock:
-                            channel_progress.pop(channel_id, None)
+                        channel_progress.pop(channel_id, None)
+                        ui_dirty.set()
 
-                # 새 작업 시작
-                for channel in active_channels:
+                # 새 작업 시작 (딜레이는 작업 시작 시 한 번만 사용)
+                for position, channel in active_channels:
                     channel_id = str(channel["id"])
                     if channel_id not in active_tasks:
-                        task = asyncio.create_task(record_stream(channel, headers, session, ffmpeg_path))
+                        task = tg.create_task(
+                            supervise_recording(channel, poller, ffmpeg_path, options, position))
+                        task.add_done_callback(lambda t, cid=channel_id: forget_task(cid, t))
                         active_tasks[channel_id] = task
                         logger.info(f"'{channel.get('name', 'Unknown')}' 채널에 대한 녹화 작업을 시작합니다.")
 
                 if not active_tasks:
                     logger.info("활성 녹화 채널이 없습니다.")
 
-                try:
-                    await asyncio.wait_for(shutdown_event.wait(), timeout=10)
-                except asyncio.TimeoutError:
-                    continue
+                await sleep_or_shutdown(10)
+
+            # 종료 시 TaskGroup이 남은 모든 작업을 한 번에 취소하고 완료될 때까지 기다림
+            logger.info("Shutting down... Cancelling all recording tasks.")
+            raise ShutdownRequested
+    except* ShutdownRequested:
+        pass
     finally:
-        # 종료 시 모든 작업 취소
-        logger.info("Shutting down... Cancelling all recording tasks.")
-        for task in active_tasks.values():
-            task.cancel()
-        if active_tasks:
-            await asyncio.gather(*active_tasks.values(), return_exceptions=True)
+        await poller.session.close()
+        await connector.close()
         logger.info("All recording tasks have been cancelled.")
 
 # --- UI 및 메인 로직 ---
@@ -452,38 +809,80 @@ def handle_shutdown():
     """애플리케이션의 정상적인 종료를 시작합니다."""
     logger.info("종료 신호를 받았습니다. 종료 중...")
     shutdown_event.set()
+    ui_dirty.set()
+
+PROGRESS_COLUMNS = ("채널", "비트레이트", "다운로드 속도", "총 크기", "경과 시간", "시작 시간")
+
+def build_progress_panel(data: ChannelProgress) -> Panel:
+    """채널 하나의 진행 상황 패널을 생성합니다."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for col in PROGRESS_COLUMNS:
+        table.add_column(col)
+    table.add_row(
+        data.channel_name, data.bitrate,
+        data.download_speed, data.total_size,
+        data.out_time, data.recording_start_time
+    )
+    return Panel(table, title=data.channel_name)
 
 async def display_progress():
     """터미널에 실시간 진행 상황 대시보드를 표시합니다."""
     layout = Layout(name="root")
     layout.split(Layout(name="upper", ratio=1), Layout(name="lower", ratio=3))
     log_messages = collections.deque(maxlen=15)
+    layout["upper"].update(Panel(Text(""), title="로그"))
 
-    with Live(layout, console=console, refresh_per_second=4, screen=True) as live:
-        while not shutdown_event.is_set() or not log_queue.empty():
-            while not log_queue.empty():
-                log_messages.append(log_queue.get_nowait())
+    # 채널별 (진행 상황 객체, 그려진 버전, 패널) 캐시와 마지막으로 그린 전체 상태
+    panel_cache: Dict[str, Tuple[ChannelProgress, int, Panel]] = {}
+    rendered_state: Optional[Tuple[Tuple[int, int], ...]] = None
 
-            layout["upper"].update(Panel(Text("\n".join(log_messages)), title="로그"))
+    global ui_loop
+    ui_loop = asyncio.get_running_loop()
+    ui_dirty.set()  # 첫 화면은 바로 그림
 
-            channel_panels = []
-            async with channel_progress_lock:
-                if not channel_progress:
+    # 주기적으로 다시 그리지 않고, 새 로그나 진행 상황 변경으로 ui_dirty가 설정될 때만 갱신
+    with Live(layout, console=console, auto_refresh=False, screen=True) as live:
+        while not shutdown_event.is_set() or not log_queue.empty():
+            await ui_dirty.wait()
+            ui_dirty.clear()
+
+            # 쌓인 로그를 한 번에 비우고, 새 로그가 있을 때만 로그 패널을 다시 구성
+            new_logs = False
+            while True:
+                try:
+                    log_messages.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+                new_logs = True
+            changed = new_logs
+            if new_logs:
+                layout["upper"].update(Panel(Text("\n".join(log_messages)), title="로그"))
+
+            snapshot = tuple(channel_progress.items())
+
+            state = tuple((id(data), data.version) for _, data in snapshot)
+            if state != rendered_state:
+                channel_panels = []
+                for channel_id, data in snapshot:
+                    cached = panel_cache.get(channel_id)
+                    if cached is None or cached[0] is not data or cached[1] != data.version:
+                        cached = (data, data.version, build_progress_panel(data))
+                        panel_cache[channel_id] = cached
+                    channel_panels.append(cached[2])
+                for channel_id in panel_cache.keys() - dict(snapshot).keys():
+                    del panel_cache[channel_id]
+
+                if not channel_panels:
                     channel_panels.append(Panel("활성 녹화 없음.", title="녹화 진행 상황"))
-                else:
-                    for data in channel_progress.values():
-                        table = Table(show_header=True, header_style="bold magenta")
-                        for col in ["채널", "비트레이트", "다운로드 속도", "총 크기", "경과 시간", "시작 시간"]:
-                            table.add_column(col)
-                        table.add_row(
-                            data.get("channel_name", "N/A"), data.get("bitrate", "N/A"),
-                            data.get("download_speed", "N/A"), data.get("total_size", "N/A"),
-                            data.get("out_time", "N/A"), data.get("recording_start_time", "N/A")
-                        )
-                        channel_panels.append(Panel(table, title=data.get("channel_name", "Unknown")))
-
-            layout["lower"].update(Group(*channel_panels))
-            await asyncio.sleep(0.25)
+                layout["lower"].update(Group(*channel_panels))
+                rendered_state = state
+                changed = True
+
+            if changed:
+                live.refresh()
+
+            # 짧은 시간 안에 몰려오는 변경을 한 번의 갱신으로 합침
+            await asyncio.sleep(0.1)
 
 async def main():
     """애플리케이션의 메인 진입점."""
@@ -503,6 +902,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("프로그램이 종료되었습니다.")
+    finally:
+        stop_logging()
@@ -4,38 +4,67 @@
 - 이전 버전의 여러 설정 파일(`channels.json`, `cookie.json` 등)을 단일 `config.json`으로 마이그레이션합니다.
 - `config.json` 파일에서 설정을 로드하고 저장하는 기능을 제공합니다.
 """
+import copy
+import hashlib
 import os
-import json
 import shutil
-from typing import Dict, Any
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import orjson
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 # --- 상수 정의 ---
-CONFIG_FILE_PATH = "config.json"
+# 실행 위치와 관계없이 스크립트가 있는 디렉터리를 기준으로 설정 파일을 찾음
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_FILE_PATH = str(BASE_DIR / "config.json")
 
 # 이전 설정 파일 경로
 OLD_FILES = {
-    "channels": "channels.json",
-    "delays": "delays.json",
-    "cookies": "cookie.json",
-    "threads": "thread.txt",
-    "rescan_interval": "time_sleep.txt",
-    "logging_enabled": "log_enabled.txt",
-    "channel_count": "channel_count.txt"
+    key: str(BASE_DIR / name)
+    for key, name in {
+        "channels": "channels.json",
+        "delays": "delays.json",
+        "cookies": "cookie.json",
+        "threads": "thread.txt",
+        "rescan_interval": "time_sleep.txt",
+        "logging_enabled": "log_enabled.txt",
+        "channel_count": "channel_count.txt",
+    }.items()
 }
 
+# Windows에서 다른 프로세스가 설정 파일을 열고 있어 교체가 거부될 때 다시 시도하는 횟수와 간격(초)
+REPLACE_RETRIES = 5
+REPLACE_RETRY_DELAY = 0.05
+
+# 마지막으로 읽거나 저장한 설정과 그 시점의 파일 상태 (수정 시각, 크기)
+# 호출자가 받은 설정을 직접 수정하므로, 캐시는 자신만의 사본을 보관하고 사본을 내어줌
+_config_cache: Dict[str, Any] = {"stamp": None, "config": None}
+
+# 경로별로 마지막으로 쓴 내용의 해시와 쓴 직후의 파일 상태
+_last_written: Dict[str, Tuple[bytes, Optional[Tuple[int, int]]]] = {}
+
+# GUI의 백그라운드 저장 스레드와 UI 스레드가 함께 접근하므로, 위 두 상태는 이 잠금 안에서만 읽고 씀
+# (캐시된 설정 객체는 교체만 되고 수정되지 않으므로 복사는 잠금 밖에서 수행)
+_state_lock = threading.Lock()
+
 def _read_old_json(file_path: str, default: Any = None) -> Any:
     """이전 JSON 파일을 읽습니다. 파일이 없으면 기본값을 반환합니다."""
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding='utf-8') as f:
-            return json.load(f)
-    return default
+    try:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return default
 
 def _read_old_text(file_path: str, default: Any = None) -> Any:
     """이전 텍스트 파일을 읽습니다. 파일이 없으면 기본값을 반환합니다."""
-    if os.path.exists(file_path):
+    try:
         with open(file_path, "r", encoding='utf-8') as f:
             return f.read().strip()
-    return default
+    except FileNotFoundError:
+        return default
 
 def _create_default_config() -> Dict[str, Any]:
     """기본 설정 딕셔너리를 생성합니다."""
@@ -86,22 +115,117 @@ def _migrate_old_config():
 def load_config() -> Dict[str, Any]:
     """
     설정을 로드합니다. config.json이 없으면 마이그레이션을 시도하거나 기본 설정을 생성합니다.
-    """
-    is_old_config_present = any(os.path.exists(p) for p in OLD_FILES.values())
 
-    if not os.path.exists(CONFIG_FILE_PATH):
-        if is_old_config_present:
+    반환된 딕셔너리는 호출자 소유의 사본이므로, 수정해도 저장하기 전까지 다른 호출에 영향을 주지 않습니다.
+    """
+    # stat 한 번으로 파일 존재 여부와 변경 여부를 함께 확인
+    stamp = get_config_stamp()
+    if stamp is None:
+        # 이전 설정 파일은 config.json이 없을 때만 확인
+        if any(os.path.exists(p) for p in OLD_FILES.values()):
             _migrate_old_config()
         else:
             print("설정 파일이 없어 새로 생성합니다.")
             default_config = _create_default_config()
             save_config(default_config)
+        stamp = get_config_stamp()
+
+    # 파일이 마지막으로 읽은 이후 바뀌지 않았다면 다시 읽지 않고 캐시된 설정의 사본을 반환
+    with _state_lock:
+        cached_stamp, cached_config = _config_cache["stamp"], _config_cache["config"]
+    if stamp is not None and stamp == cached_stamp:
+        return copy.deepcopy(cached_config)
 
     # 설정 파일 읽기
-    with open(CONFIG_FILE_PATH, "r", encoding='utf-8') as f:
-        return json.load(f)
+    with open(CONFIG_FILE_PATH, "rb") as f:
+        config = orjson.loads(f.read())
+    _update_cache(stamp, config)
+    return config
+
+def _update_cache(stamp: Optional[Tuple[int, int]], config: Dict[str, Any]):
+    """설정의 사본과 파일 상태를 한 번에 캐시에 기록합니다."""
+    snapshot = copy.deepcopy(config)
+    with _state_lock:
+        _config_cache.update(stamp=stamp, config=snapshot)
 
-def save_config(config: Dict[str, Any]):
-    """주어진 설정 딕셔너리를 config.json 파일에 저장합니다."""
-    with open(CONFIG_FILE_PATH, "w", encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+def next_channel_identifier(channels: List[Dict[str, Any]]) -> str:
+    """기존 식별자 중 가장 큰 번호 다음의 채널 식별자(`chN`)를 반환합니다.
+
+    채널을 삭제해도 다른 채널의 식별자를 다시 매기지 않으므로, 목록 길이가 아니라 사용 중인 번호로 계산합니다.
+    """
+    numbers = (ch.get("identifier", "")[2:] for ch in channels)
+    return f"ch{max((int(n) for n in numbers if n.isdecimal()), default=0) + 1}"
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """파일의 (수정 시각, 크기)를 반환합니다. 파일이 없으면 None을 반환합니다."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _atomic_write(path: str, data: bytes) -> Optional[Tuple[int, int]]:
+    """임시 파일에 쓴 뒤 교체하여, 쓰는 도중 중단되어도 기존 파일이 깨지지 않도록 저장합니다.
+
+    마지막으로 쓴 내용과 같고 그 이후 파일이 바뀌지 않았다면 쓰지 않습니다.
+    쓴 직후(또는 건너뛴 경우 현재)의 파일 상태 (수정 시각, 크기)를 반환합니다.
+    """
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    with _state_lock:
+        last = _last_written.get(path)
+    if last is not None and last[0] == digest and last[1] is not None and last[1] == _file_stamp(path):
+        return last[1]
+
+    # GUI와 설정 CLI가 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 고유한 이름을 사용
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    stamp = _file_stamp(path)
+    with _state_lock:
+        _last_written[path] = (digest, stamp)
+    return stamp
+
+def _replace(src: str, dst: str):
+    """os.replace로 파일을 교체합니다.
+
+    Windows에서는 다른 프로세스가 대상 파일을 잠시 열고 있으면 PermissionError가 나므로 몇 번 다시 시도합니다.
+    """
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if os.name != "nt" or attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(REPLACE_RETRY_DELAY * (attempt + 1))
+
+def save_config(config: Dict[str, Any], sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """주어진 설정 딕셔너리를 config.json 파일에 저장하고, 저장된 설정을 반환합니다.
+
+    sections가 주어지면 해당 최상위 항목만 현재 파일 내용에 덮어써서 저장하므로,
+    다른 프로그램(GUI 등)이 그 사이 바꾼 나머지 항목을 되돌리지 않습니다.
+    """
+    if sections is not None and get_config_stamp() is not None:
+        merged = load_config()
+        for section in sections:
+            merged[section] = config[section]
+        config = merged
+    # 쓴 직후의 파일 상태와 짝지어 캐시하여, 그 사이 다른 프로그램이 바꾼 내용을 놓치지 않도록 함
+    stamp = _atomic_write(CONFIG_FILE_PATH, orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    _update_cache(stamp, config)
+    return config
+
+def get_config_stamp() -> Optional[Tuple[int, int]]:
+    """config.json의 (수정 시각, 크기)를 반환합니다. 파일이 없으면 None을 반환합니다."""
+    return _file_stamp(CONFIG_FILE_PATH)
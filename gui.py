@@ -1,30 +1,143 @@
+import copy
+import os
 import sys
+import threading
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QListWidget, QPushButton, QLabel, QLineEdit,
+    QTabWidget, QListView, QPushButton, QLabel, QLineEdit,
     QCheckBox, QMessageBox, QInputDialog, QScrollArea, QFrame, QGridLayout
 )
-from PyQt6.QtCore import QTimer, Qt
-from config import load_config, save_config
-from typing import Dict, Any
+from PyQt6.QtCore import (
+    QAbstractListModel, QFileSystemWatcher, QModelIndex, QObject, QThreadPool, QTimer, Qt, pyqtSignal
+)
+from config import CONFIG_FILE_PATH, get_config_stamp, load_config, next_channel_identifier, save_config
+from typing import Dict, Any, List, Optional, Tuple
+
+# 편집기의 연속 저장을 한 번의 리로드로 합치기 위한 대기 시간과, 감시가 풀린 경우를 위한 예비 확인 주기 (밀리초)
+CONFIG_RELOAD_DEBOUNCE_MS = 200
+CONFIG_FALLBACK_CHECK_MS = 60_000
+# 연속된 UI 변경을 한 번의 저장으로 합치기 위한 대기 시간 (밀리초)
+CONFIG_SAVE_DEBOUNCE_MS = 500
+
+class BackgroundConfigWriter(QObject):
+    """설정 스냅샷을 스레드 풀에서 저장합니다.
+
+    한 번에 하나의 저장만 실행하며, 저장 중에 들어온 요청은 가장 최근 스냅샷 하나만 이어서 저장합니다.
+    저장이 끝날 때마다 결과를 `save_finished`(성공 여부, 오류 메시지)로 UI 스레드에 알립니다.
+    """
+    save_finished = pyqtSignal(bool, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.pending: Optional[Dict[str, Any]] = None
+        self.running = False
+        # 마지막으로 저장한 파일의 (수정 시각, 크기). 자신의 저장을 외부 변경으로 오인하지 않기 위해 사용
+        self.saved_stamp: Optional[Tuple[int, int]] = None
+
+    def submit(self, snapshot: Dict[str, Any]):
+        with self.lock:
+            self.pending = snapshot
+            if self.running:
+                return
+            self.running = True
+        QThreadPool.globalInstance().start(self.run)
+
+    def run(self):
+        while True:
+            with self.lock:
+                snapshot, self.pending = self.pending, None
+                if snapshot is None:
+                    self.running = False
+                    return
+            try:
+                save_config(snapshot)
+                self.saved_stamp = get_config_stamp()
+            except Exception as e:
+                self.save_finished.emit(False, str(e))
+            else:
+                self.save_finished.emit(True, "")
+
+class ChannelListModel(QAbstractListModel):
+    """config의 채널 목록을 그대로 참조하여 표시하는 리스트 모델입니다."""
+    def __init__(self, channels: List[Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        self.channels = channels
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.channels)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        channel = self.channels[index.row()]
+        status = "ON" if channel.get('active', 'on') == 'on' else "OFF"
+        return f"[{status}] {channel['name']} ({channel['id']})"
+
+    def set_channels(self, channels: List[Dict[str, Any]]):
+        """설정이 다시 로드되었을 때 새 채널 목록으로 교체합니다."""
+        self.beginResetModel()
+        self.channels = channels
+        self.endResetModel()
+
+    def append_channel(self, channel: Dict[str, Any]):
+        """채널 목록 끝에 채널을 추가합니다."""
+        row = len(self.channels)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.channels.append(channel)
+        self.endInsertRows()
+
+    def remove_channel(self, row: int) -> Dict[str, Any]:
+        """채널을 목록에서 제거하고 반환합니다."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        channel = self.channels.pop(row)
+        self.endRemoveRows()
+        return channel
+
+    def channel_changed(self, row: int):
+        """한 채널의 표시 내용이 바뀐 뒤 호출합니다."""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
 
 class RekodaGUI(QMainWindow):
     """Chzzk Rekoda를 위한 GUI 애플리케이션 (PyQt6 버전)"""
     def __init__(self):
         super().__init__()
         self.config: Dict[str, Any] = load_config()
+        # 마지막으로 읽거나 저장한 시점의 설정 파일 (수정 시각, 크기)
+        self.config_stamp = get_config_stamp()
+        # 아직 파일에 쓰지 않은 변경이 있는지 여부
+        self.save_pending = False
+        # 저장은 UI 스레드를 막지 않도록 백그라운드에서 수행
+        self.config_writer = BackgroundConfigWriter(self)
+        self.config_writer.save_finished.connect(self.on_save_finished)
 
         self.setWindowTitle("Chzzk Rekoda 컨트롤 패널")
         self.setGeometry(100, 100, 700, 500)
         self.setMinimumSize(600, 400)
 
+        # 변경 직후 바로 저장하지 않고, 잠시 모아서 한 번에 저장
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(CONFIG_SAVE_DEBOUNCE_MS)
+        self.save_timer.timeout.connect(self.flush_save)
+
         self.create_widgets()
         self.load_settings_to_ui()
 
-        # 주기적으로 파일 변경 감지
+        # 설정 파일 변경을 감시하고, 짧은 시간 안의 연속 변경은 한 번만 반영
+        self.config_watcher = QFileSystemWatcher([CONFIG_FILE_PATH], self)
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(CONFIG_RELOAD_DEBOUNCE_MS)
+        self.config_reload_timer.timeout.connect(self.check_for_config_changes)
+
+        # 파일 교체 등으로 감시가 풀린 경우를 대비한 예비 확인
         self.config_check_timer = QTimer(self)
         self.config_check_timer.timeout.connect(self.check_for_config_changes)
-        self.config_check_timer.start(2000)
+        self.config_check_timer.start(CONFIG_FALLBACK_CHECK_MS)
 
     def create_widgets(self):
         """GUI 위젯들을 생성합니다."""
@@ -58,7 +171,11 @@ class RekodaGUI(QMainWindow):
         
         channel_list_layout = QHBoxLayout()
         
-        self.channel_listbox = QListWidget()
+        # 채널 목록은 config를 직접 참조하는 모델로 표시하여, 바뀐 행만 다시 그림
+        self.channel_model = ChannelListModel(self.config.get('channels', []), self)
+        self.channel_listbox = QListView()
+        self.channel_listbox.setModel(self.channel_model)
+        self.channel_listbox.setUniformItemSizes(True)
         channel_list_layout.addWidget(self.channel_listbox)
 
         channel_frame.layout().addLayout(channel_list_layout)
@@ -134,7 +251,7 @@ class RekodaGUI(QMainWindow):
 
     def load_settings_to_ui(self):
         """config 파일의 내용을 UI 위젯에 로드합니다."""
-        self.update_channel_list()
+        self.channel_model.set_channels(self.config.get('channels', []))
 
         recorder_settings = self.config.get("recorder_settings", {})
         cookies = self.config.get("cookies", {})
@@ -154,17 +271,16 @@ class RekodaGUI(QMainWindow):
             self.config["cookies"]["NID_SES"] = self.nid_ses_var.text()
             self.config["cookies"]["NID_AUT"] = self.nid_aut_var.text()
 
-            save_config(self.config)
-            QMessageBox.information(self, "저장 완료", "상세 설정이 성공적으로 저장되었습니다.")
+            # 실제 저장은 백그라운드에서 끝난 뒤 on_save_finished가 결과를 표시
+            self.schedule_save()
+            self.statusBar().showMessage("상세 설정을 저장하는 중...")
         except ValueError:
             QMessageBox.critical(self, "입력 오류", "스레드 수와 재검색 간격은 숫자로 입력해야 합니다.")
 
-    def update_channel_list(self):
-        """리스트 위젯에 현재 채널 목록을 표시합니다."""
-        self.channel_listbox.clear()
-        for channel in self.config.get('channels', []):
-            status = "ON" if channel.get('active', 'on') == 'on' else "OFF"
-            self.channel_listbox.addItem(f"[{status}] {channel['name']} ({channel['id']})")
+    def selected_row(self) -> int:
+        """채널 목록에서 선택된 행 번호를 반환합니다. 선택이 없으면 -1을 반환합니다."""
+        indexes = self.channel_listbox.selectionModel().selectedIndexes()
+        return indexes[0].row() if indexes else -1
 
     def add_channel(self):
         """새 채널을 config에 추가하고 저장합니다."""
@@ -179,60 +295,99 @@ class RekodaGUI(QMainWindow):
         reply = QMessageBox.question(self, "확인", f"ID: {ch_id}\n이름: {name}\n\n추가하시겠습니까?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            channel_count = len(self.config['channels'])
-            identifier = f"ch{channel_count + 1}"
-            self.config['channels'].append({ "id": ch_id, "name": name, "output_dir": name, "identifier": identifier, "active": "on" })
-            self.config['delays'][identifier] = channel_count
+            identifier = next_channel_identifier(self.config['channels'])
+            self.channel_model.append_channel({ "id": ch_id, "name": name, "output_dir": name, "identifier": identifier, "active": "on" })
 
-            save_config(self.config)
-            self.update_channel_list()
+            self.schedule_save()
             QMessageBox.information(self, "완료", "채널이 추가되었습니다. 녹화 프로그램에 잠시 후 반영됩니다.")
 
     def delete_channel(self):
         """선택된 채널을 config에서 삭제하고 저장합니다."""
-        selected_items = self.channel_listbox.selectedItems()
-        if not selected_items:
+        choice = self.selected_row()
+        if choice < 0:
             QMessageBox.warning(self, "선택 필요", "삭제할 채널을 목록에서 선택하세요.")
             return
 
-        choice = self.channel_listbox.row(selected_items[0])
         channel = self.config['channels'][choice]
 
         reply = QMessageBox.question(self, "삭제 확인", f"'{channel['name']}' 채널을 정말로 삭제하시겠습니까?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.config['channels'].pop(choice)
-            
-            new_delays = {}
-            for i, ch in enumerate(self.config['channels']):
-                new_id = f"ch{i + 1}"
-                ch["identifier"] = new_id
-                new_delays[new_id] = i
-            self.config['delays'] = new_delays
-
-            save_config(self.config)
-            self.update_channel_list()
+            # 식별자는 다시 매기지 않고, 이전 버전이 남긴 이 채널의 딜레이 항목만 제거
+            self.channel_model.remove_channel(choice)
+            self.config['delays'].pop(channel.get('identifier', ''), None)
+
+            self.schedule_save()
             QMessageBox.information(self, "완료", "채널이 삭제되었습니다. 녹화 프로그램에 잠시 후 반영됩니다.")
 
     def toggle_channel(self):
         """선택된 채널의 녹화 상태를 토글하고 저장합니다."""
-        selected_items = self.channel_listbox.selectedItems()
-        if not selected_items:
+        choice = self.selected_row()
+        if choice < 0:
             QMessageBox.warning(self, "선택 필요", "상태를 변경할 채널을 목록에서 선택하세요.")
             return
 
-        choice = self.channel_listbox.row(selected_items[0])
         channel = self.config['channels'][choice]
         current_state = channel.get("active", "on")
         new_state = "off" if current_state == "on" else "on"
         channel["active"] = new_state
+        self.channel_model.channel_changed(choice)
 
-        save_config(self.config)
-        self.update_channel_list()
+        self.schedule_save()
         QMessageBox.information(self, "완료", f"채널 상태가 변경되었습니다. 녹화 프로그램에 잠시 후 반영됩니다.")
 
+    def on_config_file_changed(self, path: str):
+        """설정 파일 변경 알림을 받아 잠시 후 리로드를 예약합니다."""
+        self.watch_config_file()
+        self.config_reload_timer.start()
+
+    def watch_config_file(self):
+        """저장 시 파일을 교체하는 편집기 때문에 감시 대상에서 빠진 설정 파일을 다시 등록합니다."""
+        if not self.config_watcher.files() and os.path.exists(CONFIG_FILE_PATH):
+            self.config_watcher.addPath(CONFIG_FILE_PATH)
+
+    def schedule_save(self):
+        """설정 저장을 예약합니다. 대기 시간 안에 들어온 변경은 한 번의 저장으로 합쳐집니다."""
+        self.save_pending = True
+        self.save_timer.start()
+
+    def flush_save(self):
+        """예약된 설정의 스냅샷을 백그라운드 저장에 넘깁니다."""
+        self.save_timer.stop()
+        if not self.save_pending:
+            return
+        # 저장 중에 UI가 설정을 바꿔도 영향이 없도록 복사본을 넘김
+        self.config_writer.submit(copy.deepcopy(self.config))
+        self.save_pending = False
+
+    def on_save_finished(self, ok: bool, error: str):
+        """백그라운드 저장 결과를 상태 표시줄에 표시하고, 실패하면 사용자에게 알립니다."""
+        if ok:
+            self.statusBar().showMessage("설정이 저장되었습니다.", 3000)
+            return
+        # 저장하지 못한 변경은 다음 저장(또는 창을 닫을 때) 다시 쓰고, 그 전까지 파일 내용으로 덮어쓰지 않음
+        self.save_pending = True
+        self.statusBar().showMessage("설정 저장에 실패했습니다.")
+        QMessageBox.critical(self, "저장 실패", f"설정을 저장하는 중 오류가 발생했습니다:\n{error}")
+
+    def closeEvent(self, event):
+        """창을 닫기 전에 예약된 저장을 마치고 완료될 때까지 기다립니다."""
+        self.flush_save()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
+
     def check_for_config_changes(self):
         """config.json 파일이 외부에서 변경되었는지 확인하고 UI를 새로고침합니다."""
+        self.watch_config_file()
+        # 저장되지 않은 UI 변경이 있으면 곧 그 내용으로 덮어쓰므로 다시 읽지 않음
+        if self.save_pending:
+            return
+        # 파일의 수정 시각과 크기가 그대로면 읽거나 비교하지 않음
+        stamp = get_config_stamp()
+        if stamp is None or stamp in (self.config_stamp, self.config_writer.saved_stamp):
+            return
+        self.config_stamp = stamp
+
         current_config_on_disk = load_config()
         if current_config_on_disk != self.config:
             self.config = current_config_on_disk
@@ -6,14 +6,15 @@
 """
 import logging
 import re
+import threading
 import time
 from typing import Any, Dict, Tuple, Union, TypedDict, Optional, List
-from dataclasses import dataclass
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from dataclasses import dataclass, field
 
 from streamlink.exceptions import StreamError
 from streamlink.plugin import Plugin, pluginmatcher
 from streamlink.plugin.api import validate
+from streamlink.utils.parse import parse_json
 from streamlink.stream.hls import (
     HLSStream,
     HLSStreamReader,
@@ -23,6 +24,82 @@ from streamlink.stream.hls import (
 
 log = logging.getLogger(__name__)
 
+_LIVE_DETAIL_CACHE_TTL = 3.0  # 동시에 새로고침하는 스트림들이 API 응답을 공유하는 시간(초)
+
+_OLD_DOMAIN = "livecloud.pstatic.net"
+_NEW_DOMAIN = "nlive-streaming.navercdn.com"
+_HDNTS_RE = re.compile(r"([?&])hdnts=[^&#]*")
+_HDNTS_EXTRACT = re.compile(r"[?&]hdnts=([^&#]*)")
+_EXP_RE = re.compile(r"[?&]exp=(\d+)(?:[&#]|$)")
+
+# API 응답의 공통 봉투 (code와 선택적인 message, content)
+_API_RESPONSE_SCHEMA = validate.Schema(
+    {
+        "code": int,
+        validate.optional("message"): validate.any(str, None),
+        validate.optional("content"): validate.any(dict, None),
+    },
+)
+
+# 라이브 세부 정보 content의 스키마 (요청마다 만들지 않도록 한 번만 생성)
+_LIVE_DETAIL_SCHEMA = validate.Schema(
+    {
+        "status": str,
+        "liveId": int,
+        "liveTitle": validate.any(str, None),
+        "liveCategory": validate.any(str, None),
+        "adult": bool,
+        "channel": validate.all(
+            {"channelName": str},
+            validate.get("channelName"),
+        ),
+        "livePlaybackJson": validate.none_or_all(
+            str,
+            validate.parse_json(),
+            {
+                "media": [
+                    validate.all(
+                        {
+                            "mediaId": str,
+                            "protocol": str,
+                            "path": validate.url(),
+                        },
+                        validate.union_get(
+                            "mediaId",
+                            "protocol",
+                            "path",
+                        ),
+                    ),
+                ],
+            },
+            validate.get("media"),
+        ),
+    },
+    validate.union_get(
+        "livePlaybackJson",
+        "status",
+        "liveId",
+        "channel",
+        "liveCategory",
+        "liveTitle",
+        "adult",
+    ),
+)
+
+
+def _update_domain(url: str) -> str:
+    """필요한 경우 스트림 URL의 도메인을 업데이트합니다.
+
+    Args:
+        url: 업데이트할 URL.
+
+    반환값:
+        업데이트된 URL.
+    """
+    if _OLD_DOMAIN in url:
+        return url.replace(_OLD_DOMAIN, _NEW_DOMAIN)
+    return url
+
 
 class ChzzkHLSStreamWorker(HLSStreamWorker):
     """Chzzk를 위한 사용자 정의 HLS 스트림 워커입니다.
@@ -42,17 +119,21 @@ class ChzzkHLSStreamWorker(HLSStreamWorker):
         오류 발생:
             StreamError: 재시도 후에도 재생 목록을 가져올 수 없는 경우.
         """
-        for attempt in range(2):  # 실패 전 한 번 재시도
+        # 기본 워커는 매번 self.stream.url을 읽으므로, 토큰을 새로고친 뒤의 재시도는 새 URL로 요청됨
+        for attempt in (0, 1):  # 실패 전 한 번 재시도
+            requested_at = time.monotonic()
             try:
                 return super()._fetch_playlist()
             except StreamError as err:
-                if err.response is not None and err.response.status_code >= 400:
-                    self.stream.refresh_playlist()
-                    log.debug(f"오류 발생 시 채널 재생 목록 강제 새로고침: {err}")
-                else:
-                    log.debug(f"복구할 수 없는 오류 발생: {err}")
-                    raise err
-        raise StreamError("재시도 후 재생 목록을 가져오는 데 실패했습니다")
+                # HTTP 세션은 원래 요청 예외를 StreamError의 err 속성에 담아 전달함
+                response = getattr(getattr(err, "err", None), "response", None)
+                if attempt == 1 or response is None or response.status_code < 400:
+                    log.debug("복구할 수 없는 오류 발생: %s", err)
+                    raise
+                log.debug("오류 발생 시 채널 재생 목록 강제 새로고침: %s", err)
+                # 거부된 요청보다 먼저 조회된 캐시 응답은 같은 토큰일 수 있으므로 쓰지 않음.
+                # 같은 오류를 겪은 다른 워커가 그 이후에 조회한 응답은 그대로 재사용함
+                self.stream.refresh_playlist(not_before=requested_at)
 
 
 class ChzzkHLSStreamReader(HLSStreamReader):
@@ -69,10 +150,16 @@ class ChzzkHLSStream(HLSStream):
 
     __shortname__ = "hls-chzzk"
     __reader__ = ChzzkHLSStreamReader
+    # 세그먼트마다 읽는 속성을 슬롯에 저장 (기본 클래스에 __dict__가 있어 나머지 속성은 그대로 동작)
+    __slots__ = ("_url", "_channel_id", "_api", "_expire", "_refresh_before")
 
-    _REFRESH_BEFORE = 3 * 60 * 60  # 3시간
+    _REFRESH_BEFORE = 3 * 60 * 60  # 3시간 (새로고침 여유 시간의 상한)
+    _MIN_REFRESH_BEFORE = 60
+    _REFRESH_RATIO = 0.2  # 관측된 토큰 수명 중 만료 전 새로고침에 쓰는 비율
 
-    def __init__(self, session, url: str, channel_id: str, *args, **kwargs) -> None:
+    def __init__(
+        self, session, url: str, channel_id: str, *args, api: Optional["ChzzkAPI"] = None, **kwargs
+    ) -> None:
         """ChzzkHLSStream을 초기화합니다.
 
         Args:
@@ -80,25 +167,30 @@ class ChzzkHLSStream(HLSStream):
             url: HLS 스트림 URL.
             channel_id: Chzzk 채널 ID.
             *args: 기본 클래스를 위한 추가 인수.
+            api: 플러그인과 공유할 API 클라이언트. 없으면 새로 생성합니다.
             **kwargs: 기본 클래스를 위한 추가 키워드 인수.
         """
         super().__init__(session, url, *args, **kwargs)
         self._url = url
         self._channel_id = channel_id
-        self._api = ChzzkAPI(session)
+        self._api = api if api is not None else ChzzkAPI(session)
         self._expire = self._get_expire_time(url)
+        self._refresh_before = self._get_refresh_before()
 
-    def refresh_playlist(self) -> None:
+    def refresh_playlist(self, not_before: Optional[float] = None) -> None:
         """새 토큰을 얻기 위해 스트림 URL을 새로고칩니다.
 
         이 메서드는 최신 라이브 세부 정보를 가져와 유효한 HLS 스트림을 찾고
         현재 스트림 URL을 새 토큰으로 업데이트합니다.
 
+        Args:
+            not_before: 주어지면 이 시각(time.monotonic) 이전에 조회된 라이브 세부 정보는 재사용하지 않습니다.
+
         오류 발생:
             StreamError: 새 스트림 URL을 얻을 수 없는 경우.
         """
         log.debug("새 토큰을 얻기 위해 스트림 URL을 새로고칩니다.")
-        datatype, data = self._api.get_live_detail(self._channel_id)
+        datatype, data = self._api.get_live_detail(self._channel_id, not_before=not_before)
         if datatype == "error":
             raise StreamError(data)
         if not data or len(data) < 2:
@@ -112,30 +204,25 @@ class ChzzkHLSStream(HLSStream):
                 and media_info[1] == "HLS"
                 and media_info[0] == "HLS"
             ):
-                media_path = self._update_domain(media_info[2])
+                media_path = _update_domain(media_info[2])
                 res = self._fetch_variant_playlist(self.session, media_path)
                 m3u8 = parse_m3u8(res)
                 for playlist in m3u8.playlists:
                     if playlist.stream_info:
-                        new_url = self._update_domain(playlist.uri)
-                        self._replace_token(new_url)
-                        log.debug(f"스트림 URL을 {self._url}(으)로 새로고쳤습니다")
-                        self._expire = self._get_expire_time(self._url)
+                        self._apply_token(_update_domain(playlist.uri))
                         return
         raise StreamError("새로고친 재생 목록에서 유효한 HLS 스트림을 찾을 수 없습니다.")
 
-    def _update_domain(self, url: str) -> str:
-        """필요한 경우 스트림 URL의 도메인을 업데이트합니다.
+    def _apply_token(self, new_url: str) -> None:
+        """새 URL의 토큰을 현재 스트림 URL에 적용하고 만료 시간을 갱신합니다.
 
         Args:
-            url: 업데이트할 URL.
-
-        반환값:
-            업데이트된 URL.
+            new_url: 업데이트된 토큰을 포함하는 새 URL.
         """
-        if "livecloud.pstatic.net" in url:
-            return url.replace("livecloud.pstatic.net", "nlive-streaming.navercdn.com")
-        return url
+        self._replace_token(new_url)
+        log.debug("스트림 URL을 %s(으)로 새로고쳤습니다", self._url)
+        self._expire = self._get_expire_time(self._url)
+        self._refresh_before = self._get_refresh_before()
 
     def _replace_token(self, new_url: str) -> None:
         """현재 스트림 URL의 토큰을 새 토큰으로 바꿉니다.
@@ -143,15 +230,15 @@ class ChzzkHLSStream(HLSStream):
         Args:
             new_url: 업데이트된 토큰을 포함하는 새 URL.
         """
-        parsed_old = urlparse(self._url)
-        parsed_new = urlparse(new_url)
-        qs_old = parse_qs(parsed_old.query)
-        qs_new = parse_qs(parsed_new.query)
-        # 'hdnts' 매개변수를 새 토큰으로 교체
-        if "hdnts" in qs_new:
-            qs_old["hdnts"] = qs_new.get("hdnts")
-        new_query = urlencode(qs_old, doseq=True)
-        self._url = urlunparse(parsed_old._replace(query=new_query))
+        match = _HDNTS_EXTRACT.search(new_url)
+        if not match:
+            return
+        # 'hdnts' 매개변수만 새 토큰으로 교체하고, 나머지 쿼리는 순서와 인코딩을 그대로 유지
+        token = match.group(1)
+        url, count = _HDNTS_RE.subn(lambda m: f"{m.group(1)}hdnts={token}", self._url, count=1)
+        if not count:
+            url = f"{url}{'&' if '?' in url else '?'}hdnts={token}"
+        self._url = url
 
     def _get_expire_time(self, url: str) -> Optional[int]:
         """URL의 'exp' 매개변수에서 만료 시간을 추출합니다.
@@ -162,12 +249,22 @@ class ChzzkHLSStream(HLSStream):
         반환값:
             정수 형태의 만료 타임스탬프, 찾을 수 없는 경우 None.
         """
-        parsed_url = urlparse(url)
-        qs = parse_qs(parsed_url.query)
-        exp_values = qs.get("exp")
-        if exp_values and exp_values[0].isdigit():
-            return int(exp_values[0])
-        return None
+        match = _EXP_RE.search(url)
+        return int(match.group(1)) if match else None
+
+    def _get_refresh_before(self) -> int:
+        """토큰 수명에 비례하는 새로고침 여유 시간을 계산합니다.
+
+        수명이 짧은 토큰에서 매 세그먼트마다 새로고침하지 않도록, 남은 수명의 일정 비율을
+        최소 1분, 최대 3시간 범위에서 사용합니다.
+
+        반환값:
+            만료 몇 초 전에 새로고칠지를 나타내는 값.
+        """
+        if self._expire is None:
+            return self._REFRESH_BEFORE
+        lifetime = self._expire - time.time()
+        return min(self._REFRESH_BEFORE, max(self._MIN_REFRESH_BEFORE, int(lifetime * self._REFRESH_RATIO)))
 
     def _should_refresh(self) -> bool:
         """스트림 URL을 새로고쳐야 하는지 결정합니다.
@@ -177,7 +274,7 @@ class ChzzkHLSStream(HLSStream):
         """
         return (
             self._expire is not None
-            and time.time() >= self._expire - self._REFRESH_BEFORE
+            and time.time() >= self._expire - self._refresh_before
         )
 
     @property
@@ -205,15 +302,19 @@ class ChzzkAPI:
     _CHANNELS_LIVE_DETAIL_URL: str = (
         "https://api.chzzk.naver.com/service/v3/channels/{channel_id}/live-detail"
     )
+    # 채널 ID별 (조회 시각, 응답) 캐시와, 같은 채널의 동시 조회를 한 번의 요청으로 합치기 위한 채널별 잠금
+    _live_detail_cache: Dict[str, Tuple[float, Any]] = field(default_factory=dict, init=False, repr=False)
+    _live_detail_locks: Dict[str, threading.Lock] = field(default_factory=dict, init=False, repr=False)
+    _live_detail_locks_guard: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def _query_api(
-        self, url: str, *schemas: validate.Schema
+        self, url: str, schema: validate.Schema
     ) -> Tuple[str, Union[Dict[str, Any], str]]:
         """Chzzk API에 쿼리를 수행합니다.
 
         Args:
             url: API 엔드포인트 URL.
-            *schemas: 응답에 대한 유효성 검사 스키마.
+            schema: 응답 content에 대한 유효성 검사 스키마.
 
         반환값:
             상태('success' 또는 'error')와 응답 데이터 또는 오류 메시지를 포함하는 튜플.
@@ -222,90 +323,50 @@ class ChzzkAPI:
             url,
             acceptable_status=(200, 404),
             headers={"Referer": "https://chzzk.naver.com/"},
-            schema=validate.Schema(
-                validate.parse_json(),
-                validate.any(
-                    validate.all(
-                        {
-                            "code": int,
-                            "message": str,
-                        },
-                        validate.transform(lambda data: ("error", data["message"])),
-                    ),
-                    validate.all(
-                        {
-                            "code": 200,
-                            "content": None,
-                        },
-                        validate.transform(lambda _: ("success", None)),
-                    ),
-                    validate.all(
-                        {
-                            "code": 200,
-                            "content": dict,
-                        },
-                        validate.get("content"),
-                        *schemas,
-                        validate.transform(lambda data: ("success", data)),
-                    ),
-                ),
-            ),
         )
-        return response
-
-    def get_live_detail(self, channel_id: str) -> Tuple[str, Union[LiveDetail, str]]:
+        data = parse_json(response.text, schema=_API_RESPONSE_SCHEMA)
+        # 응답 코드로 먼저 분기하고, 성공 응답의 content에만 상세 스키마를 적용
+        if data["code"] != 200:
+            return "error", data.get("message", "")
+        content = data.get("content")
+        if content is None:
+            return "success", None
+        return "success", schema.validate(content)
+
+    def get_live_detail(
+        self, channel_id: str, not_before: Optional[float] = None
+    ) -> Tuple[str, Union[LiveDetail, str]]:
         """주어진 채널의 라이브 스트림 세부 정보를 가져옵니다.
 
+        여러 스트림 워커가 동시에 토큰을 새로고칠 때 API를 반복 호출하지 않도록,
+        짧은 시간 동안 같은 채널의 응답을 재사용합니다. 다른 채널의 조회는 기다리지 않습니다.
+
         Args:
             channel_id: 채널 ID.
+            not_before: 주어지면 이 시각(time.monotonic) 이후에 시작한 조회의 응답만 재사용합니다.
+                거부된 토큰이 담긴 응답을 다시 받지 않으면서, 같은 오류로 동시에 들어온 새로고침은 한 번의 요청으로 합칩니다.
 
         반환값:
             상태와 라이브 세부 정보 또는 오류 메시지를 포함하는 튜플.
         """
-        return self._query_api(
-            self._CHANNELS_LIVE_DETAIL_URL.format(channel_id=channel_id),
-            {
-                "status": str,
-                "liveId": int,
-                "liveTitle": validate.any(str, None),
-                "liveCategory": validate.any(str, None),
-                "adult": bool,
-                "channel": validate.all(
-                    {"channelName": str},
-                    validate.get("channelName"),
-                ),
-                "livePlaybackJson": validate.none_or_all(
-                    str,
-                    validate.parse_json(),
-                    {
-                        "media": [
-                            validate.all(
-                                {
-                                    "mediaId": str,
-                                    "protocol": str,
-                                    "path": validate.url(),
-                                },
-                                validate.union_get(
-                                    "mediaId",
-                                    "protocol",
-                                    "path",
-                                ),
-                            ),
-                        ],
-                    },
-                    validate.get("media"),
-                ),
-            },
-            validate.union_get(
-                "livePlaybackJson",
-                "status",
-                "liveId",
-                "channel",
-                "liveCategory",
-                "liveTitle",
-                "adult",
-            ),
-        )
+        with self._live_detail_locks_guard:
+            lock = self._live_detail_locks.setdefault(channel_id, threading.Lock())
+        with lock:
+            cached = self._live_detail_cache.get(channel_id)
+            now = time.monotonic()
+            if (
+                cached is not None
+                and now - cached[0] < _LIVE_DETAIL_CACHE_TTL
+                and (not_before is None or cached[0] >= not_before)
+            ):
+                return cached[1]
+            # 조회를 시작한 시각을 기록하여, 응답이 오는 사이 실패한 요청이 이 응답을 새 것으로 오인하지 않도록 함
+            result = self._query_api(
+                self._CHANNELS_LIVE_DETAIL_URL.format(channel_id=channel_id),
+                _LIVE_DETAIL_SCHEMA,
+            )
+            self._live_detail_cache[channel_id] = (now, result)
+            return result
 
 
 @pluginmatcher(
@@ -355,39 +416,24 @@ class Chzzk(Plugin):
             log.error(f"이 스트림은 {'성인 전용이거나' if adult else '사용할 수 없습니다'}")
             return None
 
-        streams = {}
-        for media_info in media:
-            if (
-                len(media_info) >= 3
-                and media_info[1] == "HLS"
-                and media_info[0] == "HLS"
-            ):
-                media_path = self._update_domain(media_info[2])
-                hls_streams = ChzzkHLSStream.parse_variant_playlist(
-                    self.session,
-                    media_path,
-                    channel_id=channel_id,
-                )
-                if hls_streams:
-                    streams.update(hls_streams)
+        # 라이브 세부 정보에는 HLS 항목이 하나뿐이므로 첫 항목에서 탐색을 멈춤
+        hls = next(
+            (m for m in media if len(m) >= 3 and m[0] == "HLS" and m[1] == "HLS"),
+            None,
+        )
+        streams = None
+        if hls is not None:
+            streams = ChzzkHLSStream.parse_variant_playlist(
+                self.session,
+                _update_domain(hls[2]),
+                channel_id=channel_id,
+                api=self._api,
+            )
         if not streams:
             log.error("유효한 HLS 스트림을 찾을 수 없습니다.")
             return None
         return streams
 
-    def _update_domain(self, url: str) -> str:
-        """필요한 경우 스트림 URL의 도메인을 업데이트합니다.
-
-        Args:
-            url: 업데이트할 URL.
-
-        반환값:
-            업데이트된 URL.
-        """
-        if "livecloud.pstatic.net" in url:
-            return url.replace("livecloud.pstatic.net", "nlive-streaming.navercdn.com")
-        return url
-
     def _get_streams(self) -> Optional[Dict[str, HLSStream]]:
         """스트림을 발견하는 메인 메서드입니다.
 